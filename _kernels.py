@@ -0,0 +1,178 @@
+import ctypes
+import os
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # 未安装 Numba 时退回纯 NumPy 实现
+    njit = None
+
+
+# =========================
+# 1. 融合 XOR 与统计量的计算核
+# =========================
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _xor_and_stats_numba(img, key, out):
+        n = img.size
+        s = 0
+        sq = 0
+        for i in prange(n):
+            c = img[i] ^ key[i]
+            out[i] = c
+            v = np.int64(c)
+            s += v
+            sq += v * v
+        return s, sq
+
+
+def _xor_and_stats_numpy(img, key, out):
+    np.bitwise_xor(img, key, out=out)
+    hist = np.bincount(out, minlength=256)
+    vals = np.arange(256, dtype=np.int64)
+    return int((hist * vals).sum()), int((hist * vals * vals).sum())
+
+
+def xor_and_stats(img: np.ndarray, key: np.ndarray, out: np.ndarray):
+    """
+    一次遍历完成 out = img ^ key，并同时累加密文像素的和与平方和
+    安装了 Numba 时使用多线程并行计算核，否则退回 NumPy 实现
+    :param img: 一维连续 uint8 数组
+    :param key: 与 img 等长的一维连续 uint8 数组
+    :param out: 与 img 等长的一维连续 uint8 数组，用于写入密文
+    :return: (s, sq)，密文像素的和与平方和（int）
+    """
+    if njit is not None:
+        s, sq = _xor_and_stats_numba(img, key, out)
+        return int(s), int(sq)
+    return _xor_and_stats_numpy(img, key, out)
+
+
+# =========================
+# 2. uint8 直方图
+# =========================
+# 像素数达到该值（约 4096×4096）才使用 Numba 计算核：首次调用需要数秒 JIT 编译，
+# 小图像用 np.bincount 只需几毫秒，编译开销得不偿失
+_NUMBA_HIST_MIN_SIZE = 1 << 24
+
+if njit is not None:
+
+    @njit(parallel=True, boundscheck=False, cache=True)
+    def _hist_u8_numba(a, nchunks):
+        # 每个线程块各自统计一份局部直方图，最后再合并，避免线程间写冲突
+        n = a.size
+        local = np.zeros((nchunks, 256), np.int64)
+        chunk = (n + nchunks - 1) // nchunks
+        for t in prange(nchunks):
+            start = t * chunk
+            end = min(start + chunk, n)
+            for i in range(start, end):
+                local[t, a[i]] += 1
+        return local.sum(axis=0)
+
+
+def hist_u8(a: np.ndarray) -> np.ndarray:
+    """
+    统计一维连续 uint8 数组的 256 级直方图
+    安装了 Numba 且图像足够大时按线程分块并行统计，否则使用 np.bincount
+    :return: 长度为 256 的 int64 数组
+    """
+    if njit is not None and a.size >= _NUMBA_HIST_MIN_SIZE:
+        return _hist_u8_numba(a, get_num_threads())
+    return np.bincount(a, minlength=256).astype(np.int64, copy=False)
+
+
+# =========================
+# 3. C + SIMD 字节 XOR（ctypes 调用 _xor_simd.c）
+# =========================
+def _load_xor_simd():
+    """
+    加载与本文件同目录下编译好的 _xor_simd 动态库，找不到时返回 None
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ("_xor_simd.so", "_xor_simd.dylib", "_xor_simd.dll"):
+        path = os.path.join(here, name)
+        if not os.path.exists(path):
+            continue
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            continue
+        lib.xor_u8.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+        lib.xor_u8.restype = None
+        return lib
+    return None
+
+
+_xor_simd = _load_xor_simd()
+HAS_XOR_SIMD = _xor_simd is not None
+
+
+def xor_u8(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    out = a ^ b，三者须为等长的连续 uint8 数组，out 须可写
+    已编译 _xor_simd 动态库时调用 AVX2 / AVX-512 实现，否则退回 np.bitwise_xor
+    C 实现直接按地址读写内存，因此调用前先检查参数，不满足时抛出 ValueError
+    """
+    if not (a.dtype == b.dtype == out.dtype == np.uint8):
+        raise ValueError("a、b、out 必须都是 uint8 数组")
+    if not (a.size == b.size == out.size):
+        raise ValueError("a、b、out 的元素个数必须相同")
+    if not (a.flags.c_contiguous and b.flags.c_contiguous and out.flags.c_contiguous):
+        raise ValueError("a、b、out 必须是内存连续（C 顺序）的数组")
+    if not out.flags.writeable:
+        raise ValueError("out 必须是可写数组")
+
+    if _xor_simd is not None:
+        _xor_simd.xor_u8(a.ctypes.data, b.ctypes.data, out.ctypes.data, a.size)
+    else:
+        np.bitwise_xor(a, b, out=out)
+    return out
+
+
+def _buffer_arg(buf, writable: bool = False):
+    """
+    把字节缓冲区转换为可直接传给 C 函数的参数，不经过 NumPy
+    :return: (参数, 字节数)；bytes 直接传入（ctypes 会传递其内部指针），
+             可写缓冲区（bytearray 等）用 ctypes 数组包装，均不复制数据
+    """
+    if isinstance(buf, bytes):
+        if writable:
+            raise ValueError("out 必须是可写缓冲区，例如 bytearray")
+        return buf, len(buf)
+    nbytes = memoryview(buf).nbytes
+    try:
+        return (ctypes.c_char * nbytes).from_buffer(buf), nbytes
+    except TypeError:
+        # 只读缓冲区（如指向 bytes 的 memoryview）无法被 ctypes 包装
+        if writable:
+            raise ValueError("out 必须是可写缓冲区，例如 bytearray") from None
+        data = bytes(buf)
+        return data, len(data)
+
+
+def xor_bytes(a, b, out):
+    """
+    对字节缓冲区（bytes / bytearray / memoryview 等）做 out = a ^ b
+    已编译 _xor_simd 动态库时用 ctypes 直接把缓冲区地址交给 C 实现，否则退回 np.bitwise_xor
+    只读的非 bytes 缓冲区（如指向 bytes 的 memoryview）会先复制一份
+    :param out: 可写缓冲区（如 bytearray），长度须与 a、b 相同
+    """
+    if _xor_simd is None:
+        va = np.frombuffer(a, dtype=np.uint8)
+        vb = np.frombuffer(b, dtype=np.uint8)
+        vout = np.frombuffer(out, dtype=np.uint8)
+        if not vout.flags.writeable:
+            raise ValueError("out 必须是可写缓冲区，例如 bytearray")
+        xor_u8(va, vb, vout)
+        return out
+
+    pa, na = _buffer_arg(a)
+    pb, nb = _buffer_arg(b)
+    pout, nout = _buffer_arg(out, writable=True)
+    if not (na == nb == nout):
+        raise ValueError("a、b、out 的长度必须相同")
+    _xor_simd.xor_u8(pa, pb, pout, nout)
+    return out
@@ -1,91 +1,448 @@
 import numpy as np
-from PIL import Image
+from PIL import Image, UnidentifiedImageError
 import os
+import secrets
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
+
+from _kernels import HAS_XOR_SIMD, hist_u8, xor_and_stats, xor_bytes, xor_u8
+
+
+# 分块处理时每块的字节数（约 1 MiB），保证密钥块在缓存中即用即弃
+_TILE_BYTES = 1 << 20
 
 
 # =========================
 # 1. 工具函数：读取与保存灰度图像
 # =========================
-def load_gray_image(path: str) -> np.ndarray:
+def _raw_pixel_offset(img: Image.Image) -> int | None:
+    """
+    若图像为未压缩的 8 位灰度数据且像素在文件中按行连续存放（如未压缩 TIFF），
+    返回像素数据在文件中的起始偏移，否则返回 None
+    """
+    if img.mode != "L" or not img.tile:
+        return None
+
+    w = img.size[0]
+    base = img.tile[0][2]
+    for codec, extents, offset, args in img.tile:
+        if isinstance(args, str):
+            args = (args, 0, 1)
+        rawmode = args[0]
+        stride = args[1] if len(args) > 1 else 0
+        orientation = args[2] if len(args) > 2 else 1
+        x0, y0, x1, _ = extents
+        if (
+            codec != "raw"
+            or rawmode != "L"
+            or stride not in (0, w)
+            or orientation != 1
+            or (x0, x1) != (0, w)
+            or offset != base + y0 * w
+        ):
+            return None
+    return base
+
+
+def load_gray_image(path: str, mmap: bool = False) -> np.ndarray:
     """
     读取一张本地灰度图像，返回像素矩阵（uint8）
+    :param mmap: 为 True 且文件为未压缩灰度格式时，直接内存映射像素区域（只读），
+                 由操作系统按需换入，适合超大图像；其他格式仍按常规方式解码
     """
+    if mmap:
+        with Image.open(path) as img:
+            offset = _raw_pixel_offset(img)
+            w, h = img.size
+        if offset is not None:
+            return np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=(h, w))
+
     img = Image.open(path).convert("L")  # 转为灰度图（L 模式）
     arr = np.array(img, dtype=np.uint8)
     return arr
 
 
-def save_gray_image(arr: np.ndarray, path: str):
+def load_gray_image_shape(path: str):
+    """
+    只读取图像文件头获取尺寸，不解码像素
+    :return: (高, 宽)，与 load_gray_image 返回矩阵的 shape 一致
+    """
+    with Image.open(path) as img:
+        w, h = img.size
+    return h, w
+
+
+def load_gray_image_bytes(path: str):
+    """
+    读取一张本地灰度图像，以原始字节形式返回像素数据（按行排列，每像素 1 字节）
+    :return: (pixel_bytes, (高, 宽))
+    """
+    img = Image.open(path).convert("L")  # 转为灰度图（L 模式）
+    w, h = img.size
+    return img.tobytes(), (h, w)
+
+
+def save_gray_image(arr, path: str, format: str | None = None, shape=None):
     """
     将像素矩阵保存为灰度图像
+    :param arr: 像素矩阵，或按行排列的像素字节（bytes / bytearray，此时须给出 shape）
+    :param format: 保存格式（如 "PNG" / "BMP" / "TIFF"），为 None 时由文件扩展名决定；
+                   大图像保存为 PNG 较慢时可改用 BMP / TIFF
+    :param shape: arr 为字节时图像的 (高, 宽)
     """
-    img = Image.fromarray(arr.astype(np.uint8), mode="L")
-    img.save(path)
+    if isinstance(arr, (bytes, bytearray, memoryview)):
+        if shape is None:
+            raise ValueError("以字节形式保存图像时必须提供 shape=(高, 宽)")
+        h, w = shape
+        img = Image.frombytes("L", (w, h), bytes(arr) if isinstance(arr, memoryview) else arr)
+        img.save(path, format=format)
+        return
+
+    # 已经是 uint8 时不再复制一份
+    if arr.dtype != np.uint8:
+        arr = arr.astype(np.uint8)
+    img = Image.fromarray(arr, mode="L")
+    img.save(path, format=format)
 
 
 # =========================
 # 2. 生成密钥 & 图像加解密
 # =========================
-def generate_key_matrix(shape) -> np.ndarray:
+def generate_key_matrix(shape, rng: np.random.Generator | None = None) -> np.ndarray:
     """
     生成与图像同尺寸的随机密钥矩阵（0~255）
+    :param shape: 密钥矩阵尺寸
+    :param rng: 随机数生成器，为 None 时新建一个
     """
-    key = np.random.randint(0, 256, size=shape, dtype=np.uint8)
+    if rng is None:
+        rng = np.random.default_rng()
+    # integers 直接写入 uint8 数组，无需像 rng.bytes 那样再复制一份成可写数组
+    key = rng.integers(0, 256, size=shape, dtype=np.uint8)
     return key
 
 
-def encrypt_image(image_arr: np.ndarray, key_arr: np.ndarray) -> np.ndarray:
+def _prepare_out(out: np.ndarray | None, shape) -> np.ndarray:
+    """
+    准备 XOR 结果的输出缓冲区：为 None 时新分配；
+    否则检查其尺寸、dtype 与内存布局，避免 reshape 得到副本后结果被悄悄写进副本
+    """
+    if out is None:
+        return np.empty(shape, dtype=np.uint8)
+    if out.shape != tuple(shape) or out.dtype != np.uint8:
+        raise ValueError(f"out 必须是尺寸为 {tuple(shape)} 的 uint8 数组，实际为 {out.shape} / {out.dtype}")
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("out 必须是内存连续（C 顺序）且可写的数组")
+    return out
+
+
+def _check_u8_pair(a: np.ndarray, b: np.ndarray):
+    """
+    检查参与 XOR 的两个矩阵尺寸相同且都是 uint8，不做任何隐式类型转换
+    """
+    if a.shape != b.shape:
+        raise ValueError(f"两个矩阵的尺寸必须相同，实际为 {a.shape} 与 {b.shape}")
+    if not (a.dtype == b.dtype == np.uint8):
+        raise ValueError(f"两个矩阵都必须是 uint8 数组，实际为 {a.dtype} 与 {b.dtype}")
+
+
+def _xor_u8(a: np.ndarray, b: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    两个同尺寸 uint8 矩阵按位 XOR
+    已编译 _xor_simd 动态库且数组内存连续时调用 C + SIMD 实现，否则直接使用 np.bitwise_xor
+    （NumPy 的 uint8 bitwise_xor 本身已经向量化）
+    :param out: 写入结果的连续 uint8 数组，为 None 时新分配
+    """
+    _check_u8_pair(a, b)
+    out = _prepare_out(out, a.shape)
+
+    if HAS_XOR_SIMD and a.flags.c_contiguous and b.flags.c_contiguous:
+        return xor_u8(a, b, out)
+    np.bitwise_xor(a, b, out=out)
+    return out
+
+
+def encrypt_image(
+    image_arr: np.ndarray, key_arr: np.ndarray, cipher_stats: bool = False, out: np.ndarray | None = None
+):
     """
     使用简单 XOR 对图像进行加密：
     密文 = 原图像素 ^ 密钥
+    :param cipher_stats: 为 True 时在加密的同一次遍历中顺带计算密文的平均值与方差
+    :param out: 预先分配的密文缓冲区（与图像同尺寸的连续 uint8 数组），为 None 时新分配
+    :return: cipher；cipher_stats 为 True 时返回 (cipher, mean_val, var_val)
     """
-    cipher = np.bitwise_xor(image_arr, key_arr)
-    return cipher
+    if not cipher_stats:
+        cipher = _xor_u8(image_arr, key_arr, out=out)
+        return cipher
 
+    _check_u8_pair(image_arr, key_arr)
+    # 计算核按一维连续数组遍历，只有内存不连续时才复制
+    image_arr = np.ascontiguousarray(image_arr)
+    key_arr = np.ascontiguousarray(key_arr)
+    cipher = _prepare_out(out, image_arr.shape)
+    s, sq = xor_and_stats(image_arr.reshape(-1), key_arr.reshape(-1), cipher.reshape(-1))
+    mean_val, var_val = _mean_var_from_sums(cipher.size, s, sq)
+    return cipher, mean_val, var_val
 
-def decrypt_image(cipher_arr: np.ndarray, key_arr: np.ndarray) -> np.ndarray:
+
+def decrypt_image(cipher_arr: np.ndarray, key_arr: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
     """
     使用相同的密钥进行解密：
     明文 = 密文 ^ 密钥
     （XOR 的逆运算就是自身）
+    :param out: 预先分配的明文缓冲区，为 None 时新分配
+    """
+    plain = _xor_u8(cipher_arr, key_arr, out=out)
+    return plain
+
+
+def _xor_in_tiles(arr: np.ndarray, xor_tile, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    按约 1 MiB 分块处理像素，任意时刻只有一块密钥流在缓存 / 内存中
+    :param xor_tile: 对每一块调用 xor_tile(src, dst, start)，由它生成该块密钥流并把 src ^ 密钥流 写入 dst；
+                     start 为该块在展平数组中的起始下标
+    :param out: 预先分配的输出缓冲区，为 None 时新分配
+    """
+    if arr.dtype != np.uint8:
+        raise ValueError(f"像素矩阵必须是 uint8 数组，实际为 {arr.dtype}")
+    # 只有内存不连续时才复制，不改变 dtype
+    arr = np.ascontiguousarray(arr)
+    out = _prepare_out(out, arr.shape)
+    flat_in = arr.reshape(-1)
+    flat_out = out.reshape(-1)
+
+    n = flat_in.size
+    for start in range(0, n, _TILE_BYTES):
+        end = min(start + _TILE_BYTES, n)
+        xor_tile(flat_in[start:end], flat_out[start:end], start)
+    return out
+
+
+def generate_key_seed() -> bytes:
+    """
+    生成 32 字节随机种子，用于按需重新生成与图像等长的密钥流，
+    保存种子即可代替保存 H×W 字节的密钥矩阵
+    """
+    return secrets.token_bytes(32)
+
+
+def keystream(seed: bytes, shape) -> np.ndarray:
+    """
+    由种子确定性地生成与图像同尺寸的密钥流（0~255）
+    """
+    rng = np.random.default_rng(int.from_bytes(seed, "little"))
+    n = int(np.prod(shape))
+    return np.frombuffer(rng.bytes(n), dtype=np.uint8).reshape(shape)
+
+
+def _seeded_xor(arr: np.ndarray, seed: bytes, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    由种子逐块生成密钥流并与像素做 XOR
+    块大小是 8 的倍数，分块生成的密钥流与 keystream(seed, shape) 完全一致
+    """
+    rng = np.random.default_rng(int.from_bytes(seed, "little"))
+
+    def xor_tile(src, dst, start):
+        pad = np.frombuffer(rng.bytes(src.size), dtype=np.uint8)
+        np.bitwise_xor(src, pad, out=dst)
+
+    return _xor_in_tiles(arr, xor_tile, out=out)
+
+
+def encrypt_image_seeded(image_arr: np.ndarray, seed: bytes, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    使用由种子生成的密钥流对图像进行加密：
+    密文 = 原图像素 ^ keystream(seed)
     """
-    plain = np.bitwise_xor(cipher_arr, key_arr)
+    cipher = _seeded_xor(image_arr, seed, out=out)
+    return cipher
+
+
+def decrypt_image_seeded(cipher_arr: np.ndarray, seed: bytes, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    使用同一种子重新生成密钥流进行解密
+    """
+    plain = _seeded_xor(cipher_arr, seed, out=out)
     return plain
 
 
+def generate_stream_key():
+    """
+    生成 ChaCha20 流密钥：32 字节密钥 + 16 字节 nonce
+    与密钥矩阵不同，只需保存这 48 字节即可复现与图像等长的密钥流
+    :return: (key, nonce)
+    """
+    return secrets.token_bytes(32), secrets.token_bytes(16)
+
+
+def _chacha20_xor(arr: np.ndarray, key: bytes, nonce: bytes, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    用 ChaCha20 密钥流与像素矩阵做 XOR，按约 1 MiB 分块直接写入输出矩阵，
+    工作集只有图像本身加一块密钥流，不需要与图像同尺寸的密钥矩阵
+    """
+    encryptor = Cipher(algorithms.ChaCha20(key, nonce), mode=None).encryptor()
+
+    def xor_tile(src, dst, start):
+        # ChaCha20 加密本身就是 明文 ^ 密钥流，直接写入输出块，不必单独生成密钥流再 XOR
+        encryptor.update_into(memoryview(src), memoryview(dst))
+
+    out = _xor_in_tiles(arr, xor_tile, out=out)
+    encryptor.finalize()
+    return out
+
+
+def encrypt_image_stream(
+    image_arr: np.ndarray, key: bytes, nonce: bytes, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    使用 ChaCha20 密钥流对图像进行加密：
+    密文 = 原图像素 ^ ChaCha20(key, nonce)
+    :param out: 预先分配的密文缓冲区，为 None 时新分配
+    """
+    cipher = _chacha20_xor(image_arr, key, nonce, out=out)
+    return cipher
+
+
+def decrypt_image_stream(
+    cipher_arr: np.ndarray, key: bytes, nonce: bytes, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    使用相同的 key 与 nonce 重新生成密钥流进行解密（与加密过程完全相同）
+    :param out: 预先分配的明文缓冲区，为 None 时新分配
+    """
+    plain = _chacha20_xor(cipher_arr, key, nonce, out=out)
+    return plain
+
+
+def encrypt_bytes(img_bytes, key_bytes, out_buffer: bytearray) -> bytearray:
+    """
+    直接在字节缓冲区上做 XOR 加密，结果写入预先分配的 out_buffer，
+    适合像素本身就以字节形式读写的场景（如 load_gray_image_bytes / save_gray_image）
+    :param img_bytes: 像素字节（如 load_gray_image_bytes 的返回值）
+    :param key_bytes: 与像素等长的密钥字节
+    :param out_buffer: 与像素等长的可写缓冲区（bytearray）
+    """
+    return xor_bytes(img_bytes, key_bytes, out_buffer)
+
+
+def decrypt_bytes(cipher_bytes, key_bytes, out_buffer: bytearray) -> bytearray:
+    """
+    使用相同的密钥字节解密（与加密过程完全相同）
+    """
+    return xor_bytes(cipher_bytes, key_bytes, out_buffer)
+
+
 # =========================
 # 3. 在密文状态下进行运算示例
 # =========================
-def ciphertext_statistics(cipher_arr: np.ndarray):
+def _mean_var_from_sums(n: int, s: int, sq: int):
+    """
+    由像素个数、像素和与平方和计算平均值与方差
+    方差先用整数算出分子 n·sq - s² 再做一次除法，避免 sq/n - mean² 在浮点下相减造成的精度损失
+    """
+    mean_val = s / n
+    var_val = (n * sq - s * s) / (n * n)
+    return float(mean_val), float(var_val)
+
+
+def ciphertext_statistics(cipher_arr: np.ndarray, extended: bool = False):
     """
     对密文图像做简单统计测量（例：平均值、方差）
     这里只是演示“在密文状态下运算”的概念
+    uint8 只有 256 种取值，先一次遍历得到直方图（大图像且安装 Numba 时多线程并行），
+    再由直方图算出和与平方和，避免 np.mean / np.var 两次转为 float64 遍历；
+    其他 dtype 不做转换，仍用 np.mean / np.var 计算
+    :param extended: 为 True 时额外返回信息熵与卡方均匀性检验统计量，用于衡量密文质量（仅支持 uint8）
+    :return: (mean_val, var_val)；extended 为 True 时返回 (mean_val, var_val, entropy, chi2)
     """
-    mean_val = float(np.mean(cipher_arr))
-    var_val = float(np.var(cipher_arr))
-    return mean_val, var_val
+    if cipher_arr.dtype != np.uint8:
+        if extended:
+            raise ValueError(f"extended=True 只支持 uint8 密文，实际为 {cipher_arr.dtype}")
+        mean_val = float(np.mean(cipher_arr))
+        var_val = float(np.var(cipher_arr))
+        return mean_val, var_val
+
+    flat = cipher_arr.ravel()
+    return _statistics_from_hist(hist_u8(flat), flat.size, extended)
+
+
+def _statistics_from_hist(hist: np.ndarray, n: int, extended: bool = False):
+    """
+    由 256 级直方图计算平均值、方差（以及可选的信息熵与卡方统计量），返回值同 ciphertext_statistics
+    """
+    vals = np.arange(256, dtype=np.int64)
+
+    s = int((hist * vals).sum())
+    sq = int((hist * vals * vals).sum())
+    mean_val, var_val = _mean_var_from_sums(n, s, sq)
+    if not extended:
+        return mean_val, var_val
+
+    # 信息熵（理想随机密文接近 8 bit）
+    p = hist[hist > 0] / n
+    entropy = float(-(p * np.log2(p)).sum())
+    # 卡方统计量（理想均匀分布时约为 255）
+    expected = n / 256
+    chi2 = float(((hist - expected) ** 2).sum() / expected)
+    return mean_val, var_val, entropy, chi2
 
 
-def xor_two_cipher_images(cipher_arr1: np.ndarray, cipher_arr2: np.ndarray) -> np.ndarray:
+def xor_two_cipher_images(
+    cipher_arr1: np.ndarray, cipher_arr2: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
     """
     对两幅密文图像做像素级 XOR 运算
     注意：这里只是演示操作过程，不保证有特殊的密码学意义
+    :param out: 预先分配的结果缓冲区（公共尺寸），为 None 时新分配
     """
-    # 取两张图像的公共尺寸
-    h = min(cipher_arr1.shape[0], cipher_arr2.shape[0])
-    w = min(cipher_arr1.shape[1], cipher_arr2.shape[1])
+    if cipher_arr1.shape == cipher_arr2.shape:
+        # 尺寸相同时无需切片
+        sub1, sub2 = cipher_arr1, cipher_arr2
+    else:
+        # 取两张图像的公共尺寸
+        h = min(cipher_arr1.shape[0], cipher_arr2.shape[0])
+        w = min(cipher_arr1.shape[1], cipher_arr2.shape[1])
 
-    sub1 = cipher_arr1[:h, :w]
-    sub2 = cipher_arr2[:h, :w]
+        sub1 = cipher_arr1[:h, :w]
+        sub2 = cipher_arr2[:h, :w]
 
-    result = np.bitwise_xor(sub1, sub2)
+    # 图像比公共尺寸更宽时切片不连续，仍直接交给 np.bitwise_xor 按步长遍历：
+    # 先复制成连续内存再 XOR 要多读写一遍切片，实测在各种尺寸下都更慢
+    result = _xor_u8(sub1, sub2, out=out)
     return result
 
 
 # =========================
-# 4. 主流程示例
+# 4. 批量图像处理
+# =========================
+def batch_encrypt_statistics(images, seed=None):
+    """
+    对一组图像批量执行 加密 → 密文统计 → 解密验证 的完整流程，所有图像共用一个随机数生成器
+    :param images: 灰度图像像素矩阵（uint8）的列表
+    :param seed: 随机数种子，为 None 时随机
+    :return: 列表，每项为 (mean_val, var_val, is_same)
+    """
+    rng = np.random.default_rng(seed)
+
+    results = []
+    for img in images:
+        key = generate_key_matrix(img.shape, rng)
+        cipher = encrypt_image(img, key)
+        mean_val, var_val = ciphertext_statistics(cipher)
+
+        # 解密结果写回密钥缓冲区，验证时再写回同一缓冲区，不再额外分配
+        plain = decrypt_image(cipher, key, out=key)
+        is_same = not np.bitwise_xor(plain, img, out=plain).any()
+        results.append((mean_val, var_val, is_same))
+    return results
+
+
+# =========================
+# 5. 主流程示例
 # =========================
-def main():
+def main(seed=None):
+    """
+    :param seed: 随机数种子，为 None 时每次运行生成不同密钥；固定后可复现密钥，便于对比与性能测试
+    """
     # ==== 0. 设置输入输出路径 ====
     # 请将 'input1.png' 换成你自己的灰度图像文件名
     input_image_path1 = "Couple.tif"
@@ -94,25 +451,33 @@ def main():
     output_dir = "output_images"
     os.makedirs(output_dir, exist_ok=True)
 
+    # 两张图像的密钥共用同一个随机数生成器（PCG64），不依赖 np.random 模块级的全局状态
+    rng = np.random.default_rng(seed)
+
     # ==== 1. 读取原始灰度图像 ====
     img_arr1 = load_gray_image(input_image_path1)
     print("原始图像1尺寸：", img_arr1.shape)
 
     # 可选：若存在第二张图像，则读取
-    if os.path.exists(input_image_path2):
+    try:
         img_arr2 = load_gray_image(input_image_path2)
         print("原始图像2尺寸：", img_arr2.shape)
-    else:
+    except (FileNotFoundError, UnidentifiedImageError):
         img_arr2 = None
         print("未找到第二张图像，只进行单图像加密演示。")
 
+    # 预先分配密文与明文缓冲区，加解密结果直接写入，避免每次 XOR 重新分配整幅图像
+    cipher_buf = np.empty_like(img_arr1)
+    plain_buf = np.empty_like(img_arr1)
+
     # ==== 2. 生成与图像同尺寸的密钥矩阵 ====
-    key_arr1 = generate_key_matrix(img_arr1.shape)
+    key_arr1 = generate_key_matrix(img_arr1.shape, rng)
 
     # ==== 3. 对图像进行加密 ====
-    cipher_arr1 = encrypt_image(img_arr1, key_arr1)
-    save_gray_image(cipher_arr1, os.path.join(output_dir, "cipher_image1.png"))
-    print("图像1加密完成，已保存为 cipher_image1.png")
+    cipher_arr1 = encrypt_image(img_arr1, key_arr1, out=cipher_buf)
+    # 密文接近均匀随机，PNG 的压缩几乎无收益却很耗时，因此密文以未压缩 TIFF 保存
+    save_gray_image(cipher_arr1, os.path.join(output_dir, "cipher_image1.tif"))
+    print("图像1加密完成，已保存为 cipher_image1.tif")
 
     # ==== 4. 在密文状态下计算统计量 ====
     mean_val, var_val = ciphertext_statistics(cipher_arr1)
@@ -120,26 +485,28 @@ def main():
     print("密文图像1的方差：", var_val)
 
     # ==== 5. 使用同一密钥进行解密 ====
-    decrypted_arr1 = decrypt_image(cipher_arr1, key_arr1)
+    decrypted_arr1 = decrypt_image(cipher_arr1, key_arr1, out=plain_buf)
     save_gray_image(decrypted_arr1, os.path.join(output_dir, "decrypted_image1.png"))
     print("图像1解密完成，已保存为 decrypted_image1.png")
 
     # ==== 6. 验证解密后与原图是否一致 ====
-    is_same = np.array_equal(img_arr1, decrypted_arr1)
+    # 解密正确当且仅当 解密结果 ^ 原图 全为 0；图像1的密钥此后不再使用，
+    # 直接把 XOR 结果写回密钥缓冲区，不再额外分配缓冲区或布尔掩码
+    is_same = not np.bitwise_xor(decrypted_arr1, img_arr1, out=key_arr1).any()
     print("解密后图像是否与原图完全相同：", is_same)
 
     # ==== 7. （可选）对两幅密文图像进行像素级 XOR 运算 ====
     if img_arr2 is not None:
         # 为第二张图像也生成一份密钥，并加密
-        key_arr2 = generate_key_matrix(img_arr2.shape)
+        key_arr2 = generate_key_matrix(img_arr2.shape, rng)
         cipher_arr2 = encrypt_image(img_arr2, key_arr2)
-        save_gray_image(cipher_arr2, os.path.join(output_dir, "cipher_image2.png"))
-        print("图像2加密完成，已保存为 cipher_image2.png")
+        save_gray_image(cipher_arr2, os.path.join(output_dir, "cipher_image2.tif"))
+        print("图像2加密完成，已保存为 cipher_image2.tif")
 
         # 对两幅密文图像做 XOR 运算（演示“密文域运算”）
         xor_cipher = xor_two_cipher_images(cipher_arr1, cipher_arr2)
-        save_gray_image(xor_cipher, os.path.join(output_dir, "cipher_xor.png"))
-        print("两幅密文图像 XOR 运算结果已保存为 cipher_xor.png")
+        save_gray_image(xor_cipher, os.path.join(output_dir, "cipher_xor.tif"))
+        print("两幅密文图像 XOR 运算结果已保存为 cipher_xor.tif")
 
 
 if __name__ == "__main__":
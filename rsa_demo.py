@@ -2,6 +2,14 @@ from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import serialization, hashes
 
 
+# 加解密共用的 OAEP 填充方案，模块加载时创建一次，避免每次调用重新构造
+_OAEP_SHA256 = padding.OAEP(
+    mgf=padding.MGF1(algorithm=hashes.SHA256()),
+    algorithm=hashes.SHA256(),
+    label=None,
+)
+
+
 # =========================
 # 1. 生成 RSA 密钥对
 # =========================
@@ -93,11 +101,7 @@ def rsa_encrypt(public_key, plaintext: bytes) -> bytes:
     """
     ciphertext = public_key.encrypt(
         plaintext,
-        padding.OAEP(
-            mgf=padding.MGF1(algorithm=hashes.SHA256()),
-            algorithm=hashes.SHA256(),
-            label=None,
-        ),
+        _OAEP_SHA256,
     )
     return ciphertext
 
@@ -111,11 +115,7 @@ def rsa_decrypt(private_key, ciphertext: bytes) -> bytes:
     """
     plaintext = private_key.decrypt(
         ciphertext,
-        padding.OAEP(
-            mgf=padding.MGF1(algorithm=hashes.SHA256()),
-            algorithm=hashes.SHA256(),
-            label=None,
-        ),
+        _OAEP_SHA256,
     )
     return plaintext
 